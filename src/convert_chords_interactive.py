@@ -35,9 +35,9 @@ we can modify the script, but EOF is robust and standard.
 
 ALGORITHM SUMMARY
 -----------------
-1. Read input (from a file, or from stdin/paste).
+1. Read input (from a file line by line, or from stdin/paste).
 2. Split the input into lines (preserve the sequence of blank lines).
-3. Walk lines with an index so we can look ahead:
+3. Walk lines with a one-line look-ahead:
    - If a line looks like a "chord-only" line (e.g., "Em    D    Bm  C" or
      " | B | A | E | E | x2"), we attempt to merge it with the next non-empty
      lyric line. The merge places bracketed chord tokens into the lyric
@@ -70,12 +70,15 @@ import os
 import re
 import sys
 from datetime import datetime
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 # ------------------------------------------------------------------------------
 # Regex definitions and token helpers
 # ------------------------------------------------------------------------------
-# The chord token regex attempts to capture common chord shapes:
+# The chord grammar below is shared by every chord regex in this module, so it
+# is kept as a single pattern fragment. It attempts to capture common chord
+# shapes:
 #
 #   Root:
 #     [A-G]                     -> A through G
@@ -90,51 +93,109 @@ from typing import List, Tuple
 #   Optional slash bass:
 #     (?:/[A-G](?:#|b)?)?       -> e.g. C/E or G#/Bb
 #
-# Entire pattern anchored with ^ and $ so we match the whole token.
-#
-# We compile with re.IGNORECASE to accept lowercase tokens as well (some charts
-# are inconsistent with capitalization).
-CHORD_TOKEN_RE = re.compile(
-    r"^[A-G](?:#|b)?(?:(?:maj|min|m|dim|aug|sus|add)\d*)?(?:/[A-G](?:#|b)?)?$",
-    re.IGNORECASE,
-)
+# The regexes built from it are compiled with re.IGNORECASE to accept lowercase
+# tokens as well (some charts are inconsistent with capitalization).
+_CHORD_PATTERN = r"[A-G](?:#|b)?(?:(?:maj|min|m|dim|aug|sus|add)\d*)?(?:/[A-G](?:#|b)?)?"
+
+# A single chord token. The pattern is anchored with \A and \Z so we match the
+# whole token. Unlike $, \Z does not also match before a trailing newline, so a
+# token can never carry stray line-ending characters into a match.
+CHORD_TOKEN_RE = re.compile(r"\A" + _CHORD_PATTERN + r"\Z", re.IGNORECASE)
+
+# Characters a chord token can start with. is_chord_token checks this before
+# running CHORD_TOKEN_RE so most non-chord tokens never reach the regex engine.
+_ROOTS = frozenset("ABCDEFGabcdefg")
 
 # Parenthetical annotations are things like "(x2)" or "(repeat)". Some chord
 # lines append these annotations; we should allow them on chord-only lines so
 # they don't make the line look non-chord-like.
-PAREN_ANNOTATION_RE = re.compile(r"^\(.*\)$")
+_PAREN_PATTERN = r"\(.*\)"
+PAREN_ANNOTATION_RE = re.compile(r"\A" + _PAREN_PATTERN + r"\Z")
 
 # A "bar separator" token like '|' appears in many chord charts to show bar
 # boundaries. We treat this as a neutral token that doesn't invalidate a
 # chord-only line.
-BAR_SEPARATOR_RE = re.compile(r"^\|+$")
+_BAR_PATTERN = r"\|+"
+BAR_SEPARATOR_RE = re.compile(r"\A" + _BAR_PATTERN + r"\Z")
+
+# A section header is a line consisting solely of a bracketed label such as
+# "[Chorus]" or "[Verse 1]". We never merge chords into these. Compiled once
+# here because it is tested against the look-ahead line on every chord line.
+SECTION_HEADER_RE = re.compile(r"^\s*\[.*\]\s*$")
+
+# Combined token check used on the chord-line hot path. It is the union of
+# CHORD_TOKEN_RE, PAREN_ANNOTATION_RE and BAR_SEPARATOR_RE, so one match tells
+# us whether a token is allowed on a chord-only line: no match means the token
+# is a lyric word.
+TOKEN_CLASSIFY_RE = re.compile(
+    r"\A(?:" + _CHORD_PATTERN + "|" + _PAREN_PATTERN + "|" + _BAR_PATTERN + r")\Z",
+    re.IGNORECASE,
+)
+
+# Unanchored variant of CHORD_TOKEN_RE for scanning a whole chord line. The
+# (?<!\S) / (?!\S) guards require whitespace (or a line edge) on both sides, so
+# every match is a complete whitespace-delimited token that is also a chord;
+# bar separators, annotations and partial words never match. This lets
+# merge_chords_and_lyrics locate and classify chords in a single regex pass.
+CHORD_SCAN_RE = re.compile(r"(?<!\S)" + _CHORD_PATTERN + r"(?!\S)", re.IGNORECASE)
+
+# Every ASCII character that can appear on a chord-only line outside of a
+# parenthetical annotation: chord roots, the letters of the quality keywords in
+# either case (the chord regex is case-insensitive), accidentals, digits, slash
+# bass, bar separators, and ASCII whitespace. An ASCII line containing anything
+# else must contain a lyric word, so is_chord_only_line can reject it with one
+# C-level set scan before tokenizing. Annotations like "(repeat)" may hold
+# arbitrary text, so only the part of the line before the first "(" is checked;
+# every token there must be a chord or bar separator.
+#
+# Non-ASCII lines are never rejected by this pre-filter: Unicode whitespace,
+# Unicode decimal digits (\d) and a few case-folded letters (e.g. "ſ" for "s")
+# can legitimately appear in them, so they take the full tokenizing path.
+_CHORD_LINE_ALLOWED = frozenset(
+    "ABCDEFGabcdefg"
+    "MAJINDUSGmajindusg"
+    "#/0123456789|"
+    " \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+)
 
 
 # ------------------------------------------------------------------------------
 # Token classification helpers
 # ------------------------------------------------------------------------------
+# Charts repeat the same handful of chord symbols over and over, so each helper
+# is memoized: a repeated token becomes a dict lookup instead of a regex run.
+# Inputs are short immutable strings, which makes them safe cache keys.
+#
+# All helpers expect a single, already whitespace-free token (as produced by
+# str.split() or an \S+ scan); they do not strip their argument.
+@lru_cache(maxsize=512)
 def is_chord_token(token: str) -> bool:
     """
     Return True if the single whitespace-delimited token looks like a chord.
 
-    - Strips whitespace and tests the token against CHORD_TOKEN_RE.
-    - Examples that return True: "C", "Am", "F#m7", "Bbmaj7", "G7", "C/E"
+    - Tests the (already stripped) token against CHORD_TOKEN_RE.
+    - Tokens that cannot start a chord (bar separators, annotations, most
+      words) are rejected by a first-character set lookup without entering
+      the regex engine.
+    - Examples that return True: "C", "Am", "F#m7", "Bbmaj7", "Gmaj7", "C/E"
     - Examples that return False: "She", "the", "and", "Hello", "word"
     """
-    if not token:
+    if not token or token[0] not in _ROOTS:
         return False
-    return bool(CHORD_TOKEN_RE.match(token.strip()))
+    return CHORD_TOKEN_RE.match(token) is not None
 
 
+@lru_cache(maxsize=512)
 def is_parenthetical_annotation(token: str) -> bool:
     """
     Return True if the token is a parenthetical annotation like "(x2)".
 
     These are allowed on chord-only lines and should be preserved verbatim.
     """
-    return bool(PAREN_ANNOTATION_RE.match(token.strip()))
+    return PAREN_ANNOTATION_RE.match(token) is not None
 
 
+@lru_cache(maxsize=512)
 def is_bar_separator(token: str) -> bool:
     """
     Return True if the token looks like a bar separator such as '|' or '||'.
@@ -142,7 +203,7 @@ def is_bar_separator(token: str) -> bool:
     Charts use '|' to show measure boundaries. These tokens are neither lyric
     nor chord; treat them as neutral/preserved tokens.
     """
-    return bool(BAR_SEPARATOR_RE.match(token.strip()))
+    return BAR_SEPARATOR_RE.match(token) is not None
 
 
 def is_chord_only_line(line: str) -> bool:
@@ -157,86 +218,101 @@ def is_chord_only_line(line: str) -> bool:
               - a recognized chord token (is_chord_token)
               - a bar separator token ('|' etc.)
               - a parenthetical annotation like '(x2)'
+        (all three are tested in one pass with TOKEN_CLASSIFY_RE)
       - This allows lines like:
           "Em Bm D C"
           "| B | A | E | E | x2"
           "A  E  (x2)"
       - It rejects lines that contain ordinary lyric words.
+      - Most lines in a chart are lyrics, so before tokenizing we reject any
+        line containing a character that no chord/bar token could contain
+        (see _CHORD_LINE_ALLOWED).
     """
-    tokens = [tok for tok in line.split() if tok != ""]
-    if not tokens:
-        # Empty lines are not considered chord-only.
+    head = line.partition("(")[0]
+    if not _CHORD_LINE_ALLOWED.issuperset(head) and head.isascii():
+        # Fast path: some character can only belong to a lyric word.
         return False
-    for tok in tokens:
-        if not (
-            is_chord_token(tok)
-            or is_parenthetical_annotation(tok)
-            or is_bar_separator(tok)
-        ):
-            return False
-    return True
+    # str.split() never yields empty tokens. Empty lines are not considered
+    # chord-only; otherwise all() stops at the first token that fails to match.
+    tokens = line.split()
+    return bool(tokens) and all(
+        TOKEN_CLASSIFY_RE.match(tok) is not None for tok in tokens
+    )
 
 
 # ------------------------------------------------------------------------------
 # Merge algorithm: insert bracketed chords into lyric lines
 # ------------------------------------------------------------------------------
+# "[Chord]" strings keyed by chord text. A song uses only a handful of distinct
+# chords, so each bracketed form is built once and then shared by every line
+# that uses it. Only validated chord tokens are ever stored, which keeps the
+# dict small.
+_BRACKET_CACHE: Dict[str, str] = {}
+
+
+def _bracket(chord: str) -> str:
+    """
+    Return chord wrapped in brackets ("[Em]"), reusing the cached string when
+    this chord has been formatted before.
+    """
+    bracketed = _BRACKET_CACHE.get(chord)
+    if bracketed is None:
+        bracketed = _BRACKET_CACHE[chord] = f"[{chord}]"
+    return bracketed
+
+
 def merge_chords_and_lyrics(chord_line: str, lyric_line: str) -> str:
     """
     Overlay chords (from chord_line) onto lyric_line by inserting bracketed chord
     markers at approximate column positions.
 
     Implementation details and reasoning:
-      - We locate chord tokens in chord_line using re.finditer(r'\S+'),
-        which yields each token and its starting character index.
-      - For each token that is recognized as a chord token (is_chord_token),
-        we note its start column (an integer offset from line start).
-      - We convert the lyric_line into a mutable list of characters so we can
-        insert multiple characters at precise indices. Use lyric_chars[n:n] =
-        list(bracketed) to insert multiple characters as individual list elements.
-      - We maintain an 'offset' measured in characters: after inserting "[Em]"
-        (4 characters), subsequent insert positions must be shifted right by 4.
+      - We locate chord tokens in chord_line with CHORD_SCAN_RE.finditer,
+        which yields only whitespace-delimited chord tokens together with their
+        starting character index (column). Classification happens inside the
+        scan, so no token is examined twice.
+      - We then build the output in a single forward pass: walk the chord
+        positions in column order, copy the slice of lyric_line up to each
+        column, emit the bracketed chord, and finally copy the remainder.
+        The pieces are collected in a list and joined once at the end, so the
+        work is linear in the lyric length plus the number of chords (no
+        repeated mid-list insertions that shift every trailing character).
+      - Because we slice the *original* lyric_line, chord columns map directly
+        onto lyric indices; there is no running offset to maintain.
       - If a chord's intended column is past the lyric length, we clamp to the
         end and append the bracketed chord. This is preferable to losing the chord.
       - We skip tokens that are non-chord (bar separators and parenthetical
         annotations) during position-driven merges; those tokens are handled if
         the whole line is chord-only via format_chord_only_line.
     """
-    # 1) Find tokens and their start positions in the chord line
-    chord_positions: List[Tuple[int, str]] = []
-    for match in re.finditer(r"\S+", chord_line):
-        token = match.group(0)
-        if is_chord_token(token):
-            # record (character index where the token starts, the token text)
-            chord_positions.append((match.start(), token))
-
-    # 2) Convert lyric_line into a list of single characters for precise insertion
-    lyric_chars: List[str] = list(lyric_line)
-
-    # 3) Insert bracketed chord strings into lyric_chars at approximate columns
-    offset = 0  # number of characters already inserted (affects subsequent indices)
+    # 1) Find chord tokens and their start positions in the chord line
+    # Each match is already a whole chord token: record (column, chord text)
+    chord_positions: List[Tuple[int, str]] = [
+        (match.start(), match.group(0)) for match in CHORD_SCAN_RE.finditer(chord_line)
+    ]
+
+    # finditer yields chords left to right, but sort defensively: the single
+    # forward pass below relies on non-decreasing columns.
+    chord_positions.sort(key=lambda item: item[0])
+
+    # 2) Emit lyric slices and bracketed chords in one forward pass
+    parts: List[str] = []
+    cursor = 0  # index in lyric_line up to which text has been emitted
+    lyric_len = len(lyric_line)
     for pos, chord in chord_positions:
-        # Calculate the insertion index adjusted by the offset of prior insertions
-        insert_at = pos + offset
+        # Clamp the column to the end of the lyric (chords past the end are appended)
+        clamped = min(pos, lyric_len)
 
-        # Clamp insert position to [0, len(lyric_chars)]
-        if insert_at < 0:
-            insert_at = 0
-        if insert_at > len(lyric_chars):
-            insert_at = len(lyric_chars)
+        # Copy the lyric text between the previous chord and this one
+        parts.append(lyric_line[cursor:clamped])
 
-        # Build the bracketed chord to insert (markdown-it-chords expects [Chord])
-        bracketed = f"[{chord}]"
+        # Insert the bracketed chord (markdown-it-chords expects [Chord])
+        parts.append(_bracket(chord))
+        cursor = clamped
 
-        # Insert the bracketed chord as characters (so lyric_chars remains a char list)
-        # Using slice assignment lyric_chars[insert_at:insert_at] = list(bracketed)
-        # inserts each character so index arithmetic (offset) remains correct.
-        lyric_chars[insert_at:insert_at] = list(bracketed)
-
-        # Update offset by the number of characters added
-        offset += len(bracketed)
-
-    # 4) Recombine characters into a single string and return
-    return "".join(lyric_chars)
+    # 3) Copy whatever lyric text follows the last chord and join once
+    parts.append(lyric_line[cursor:])
+    return "".join(parts)
 
 
 # ------------------------------------------------------------------------------
@@ -252,95 +328,139 @@ def format_chord_only_line(line: str) -> str:
       Output: "| [B] | [A] | [E] | [E] | x2"
 
     We do this token-by-token so that pipe characters and annotations remain unchanged.
+    Rather than tokenizing with a regex, we walk the line once, alternating
+    between runs of whitespace and runs of non-whitespace; this avoids building
+    a match object per token.
     """
-    parts = []
-    for token in re.finditer(r"\S+|\s+", line):
-        tok = token.group(0)
-        if tok.isspace():
+    parts: List[str] = []
+    i = 0
+    n = len(line)
+    while i < n:
+        j = i
+        if line[i].isspace():
             # Preserve original whitespace sequences exactly
-            parts.append(tok)
-            continue
-        # Non-space token
-        if is_chord_token(tok):
-            parts.append(f"[{tok}]")
-        elif is_parenthetical_annotation(tok) or is_bar_separator(tok):
-            # Preserve annotations like (x2) and separators like '|' unchanged
-            parts.append(tok)
+            while j < n and line[j].isspace():
+                j += 1
+            parts.append(line[i:j])
         else:
-            # As a fallback, preserve the token unchanged (shouldn't usually happen
-            # for chord-only lines because those tokens were pre-validated).
-            parts.append(tok)
+            while j < n and not line[j].isspace():
+                j += 1
+            tok = line[i:j]
+            if is_chord_token(tok):
+                parts.append(_bracket(tok))
+            else:
+                # Preserve annotations like (x2) and separators like '|' unchanged.
+                # Anything else is also preserved as a fallback (shouldn't usually
+                # happen for chord-only lines because those tokens were pre-validated).
+                parts.append(tok)
+        i = j
     return "".join(parts)
 
 
 # ------------------------------------------------------------------------------
 # Top-level processing pass: walk the input lines and convert as needed
 # ------------------------------------------------------------------------------
-def process_lines(lines: List[str]) -> List[str]:
+def process_lines(lines: Iterable[str]) -> Iterator[str]:
     """
-    Walk through lines and produce converted lines where chord-lines are merged
+    Walk through lines and yield converted lines where chord-lines are merged
     into the lyric-lines that follow them. This function carefully handles:
       - chord-only lines followed by lyric lines (merge into single inline line)
       - chord-only lines without following lyrics (convert to inline chord-only)
       - other lines (section headers, plain lyrics) are left untouched
 
     Implementation notes:
-      - We intentionally use an index-based loop (while i < n) rather than for-each
-        so we can consume the next line when we merge a chord line with its lyric.
-      - We always preserve blank lines by appending an empty string to the output
-        when lines contain no characters.
+      - We walk a single iterator with a one-line look-ahead slot ('pending')
+        rather than indexing into a list. When a chord line is not merged, the
+        line we peeked at is put back into the slot and processed next. This
+        means any iterable of lines works, as long as the lines carry no
+        trailing newline (so not a raw file object; see read_lines_from_file).
+      - We always preserve blank lines by yielding an empty string when lines
+        contain no characters.
+      - This is a generator: converted lines are produced one at a time so the
+        writer can stream them to disk without materializing a second full
+        copy of the document.
     """
-    out: List[str] = []
-    i = 0
-    n = len(lines)
-    while i < n:
-        cur_line = lines[
-            i
-        ]  # note: lines expected without trailing newline to simplify joins
+    it = iter(lines)
+    pending: Optional[str] = None
+    while True:
+        # note: lines expected without trailing newline to simplify joins
+        if pending is not None:
+            cur_line, pending = pending, None
+        else:
+            cur_line = next(it, None)
+            if cur_line is None:
+                break
 
         # Quick classification: is this a chord-only line?
         if is_chord_only_line(cur_line):
             # Look ahead to see whether there's a lyric line to merge with.
             # Typical layout: chord line, then lyric line (possibly short).
-            if i + 1 < n:
-                next_line = lines[i + 1]
-                # We require the next line to contain non-empty text to merge.
-                # If it's blank or a bracketed section header like [Chorus], we choose
-                # not to merge because those are structural labels.
-                if next_line.strip() != "" and not re.match(
-                    r"^\s*\[.*\]\s*$", next_line
-                ):
-                    # Merge chord_line (cur_line) with next_line lyrics
-                    merged = merge_chords_and_lyrics(cur_line, next_line)
-                    out.append(merged)
-                    # Skip the next line since it's been consumed by the merge
-                    i += 2
-                    continue
-            # If there was no suitable lyric to merge with, format the chord-only line
-            formatted = format_chord_only_line(cur_line)
-            out.append(formatted)
-            i += 1
+            next_line = next(it, None)
+            # We require the next line to contain non-empty text to merge.
+            # If it's blank or a bracketed section header like [Chorus], we choose
+            # not to merge because those are structural labels.
+            if (
+                next_line is not None
+                and next_line.strip() != ""
+                and not SECTION_HEADER_RE.match(next_line)
+            ):
+                # Merge chord_line (cur_line) with next_line lyrics; the next
+                # line has been consumed by the merge.
+                yield merge_chords_and_lyrics(cur_line, next_line)
+                continue
+            # If there was no suitable lyric to merge with, format the chord-only
+            # line and hand the peeked line back for normal processing.
+            yield format_chord_only_line(cur_line)
+            pending = next_line
             continue
 
         # Not a chord-only line: preserve as-is (lyrics, headers, blank lines, etc.)
-        out.append(cur_line)
-        i += 1
-
-    return out
+        yield cur_line
 
 
 # ------------------------------------------------------------------------------
 # Input reading helpers: file mode, piped mode, interactive mode
 # ------------------------------------------------------------------------------
-def read_input_from_file(path: str) -> str:
+# Line boundaries that str.splitlines() honours but file iteration does not
+# ('\n', '\r' and '\r\n' are already handled by universal newlines).
+_EXTRA_LINE_BREAKS = frozenset("\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+
+
+def read_lines_from_file(path: str) -> List[str]:
     """
-    Read entire file content and return it as a single string.
+    Read a file and return its lines without trailing newline characters.
+
+    We iterate the file object directly (universal newlines, so '\r\n' is
+    normalized to '\n') instead of reading one big string and splitting it,
+    which avoids holding the raw text and the line list in memory at once.
+    The rare line that contains one of the other boundaries str.splitlines()
+    recognizes (form feed, vertical tab, U+2028, ...) is split further, so the
+    result matches splitlines() on the whole text, as interactive mode uses.
+    The list is built eagerly so that any IO or decoding error is raised here,
+    inside the caller's error handling.
 
     We open with utf-8 and let IO errors bubble up to the caller so the main
     function can report helpful messages.
     """
+    lines: List[str] = []
     with open(path, "r", encoding="utf-8") as fh:
-        return fh.read()
+        for line in fh:
+            if _EXTRA_LINE_BREAKS.isdisjoint(line):
+                lines.append(line.rstrip("\n"))
+            else:
+                # splitlines() on the line including its '\n' yields the
+                # same pieces as splitlines() on the whole text would.
+                lines.extend(line.splitlines())
+    return lines
+
+
+# Instructions printed before reading a paste from an interactive terminal.
+_INTERACTIVE_INSTRUCTIONS = (
+    "Paste your plain-text chord chart below. When you are finished, signal EOF:\n"
+    "  - On Unix/macOS: press Ctrl-D on a new line\n"
+    "  - On Windows (cmd.exe): press Ctrl-Z then Enter on a new line\n\n"
+    "Paste now and then send EOF.\n"
+)
 
 
 def read_input_interactively() -> str:
@@ -363,13 +483,7 @@ def read_input_interactively() -> str:
         return sys.stdin.read()
 
     # Interactive TTY mode: instruct the user and then also read until EOF
-    instructions = (
-        "Paste your plain-text chord chart below. When you are finished, signal EOF:\n"
-        "  - On Unix/macOS: press Ctrl-D on a new line\n"
-        "  - On Windows (cmd.exe): press Ctrl-Z then Enter on a new line\n\n"
-        "Paste now and then send EOF.\n"
-    )
-    print(instructions, end="", flush=True)
+    print(_INTERACTIVE_INSTRUCTIONS, end="", flush=True)
 
     # Read until EOFError is raised (user sends EOF)
     try:
@@ -383,38 +497,65 @@ def read_input_interactively() -> str:
 # ------------------------------------------------------------------------------
 # Safely choose an output filename and write results, avoid clobbering files
 # ------------------------------------------------------------------------------
-def unique_output_filename(base_name: str, ext: str = ".md") -> str:
+def _create_exclusive(filename: str) -> int:
     """
-    Build a non-colliding filename in the current working directory using the
+    Atomically create filename for writing and return its file descriptor.
+
+    O_CREAT | O_EXCL makes the existence check and the creation a single
+    operation, so no other process can grab the name in between. Raises
+    FileExistsError if the file is already there.
+
+    O_BINARY (Windows only) keeps the C runtime from translating newlines on
+    the descriptor; the text wrapper from os.fdopen already writes '\r\n'
+    there, and a second translation would produce '\r\r\n'.
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    return os.open(filename, flags, 0o666)
+
+
+def unique_output_filename(base_name: str, ext: str = ".md") -> Tuple[str, int]:
+    """
+    Create a non-colliding file in the current working directory using the
     provided base_name and extension. If "<base_name><ext>" exists, append a
-    numeric suffix "-1", "-2", ... until an unused name is found. Return the
-    chosen filename (not the full path).
+    timestamp and numeric suffix "_<timestamp>_1", "_<timestamp>_2", ... until
+    an unused name is found.
+
+    Return the chosen filename (not the full path) together with an open file
+    descriptor for it. The file is created as part of choosing the name, so
+    there is no window between "is this name free?" and "open it" in which
+    another process could claim it.
     """
     candidate = f"{base_name}{ext}"
-    if not os.path.exists(candidate):
-        return candidate
+    try:
+        return candidate, _create_exclusive(candidate)
+    except FileExistsError:
+        pass
 
-    # If it exists, append a timestamp + counter to be extra-safe
+    # If it exists, append a timestamp + counter to be extra-safe. The
+    # timestamp is only computed once we know there is a collision.
     timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
     counter = 1
     while True:
         candidate = f"{base_name}_{timestamp}_{counter}{ext}"
-        if not os.path.exists(candidate):
-            return candidate
-        counter += 1
+        try:
+            return candidate, _create_exclusive(candidate)
+        except FileExistsError:
+            counter += 1
 
 
-def write_output_file(filename: str, lines: List[str]) -> str:
+def write_output_file(filename: str, fd: int, lines: Iterable[str]) -> str:
     """
-    Write the list of output lines to the filename (in the current directory).
+    Write the output lines to the already-created file descriptor fd
+    (as returned by unique_output_filename for filename).
     Returns the absolute path to the written file.
 
-    The function joins lines with a single '\n' and ensures the file ends with
-    a newline (common convention for text files).
+    Each line is written followed by a single '\n', so the file ends with a
+    newline (common convention for text files). Lines are streamed through a
+    64 KiB write buffer rather than joined into one large string first, so we
+    never hold a second full copy of the document in memory.
     """
-    content = "\n".join(lines) + "\n"
-    with open(filename, "w", encoding="utf-8") as fh:
-        fh.write(content)
+    with os.fdopen(fd, "w", encoding="utf-8", buffering=65536) as fh:
+        fh.writelines(f"{line}\n" for line in lines)
     return os.path.abspath(filename)
 
 
@@ -447,33 +588,33 @@ def main(argv: List[str]) -> None:
         # FILE MODE ----------------------------------------------------------
         input_path = argv[1]
         try:
-            raw = read_input_from_file(input_path)
-        except FileNotFoundError:
-            print(f"Error: file not found: {input_path}", file=sys.stderr)
-            sys.exit(2)
-        except IOError as e:
+            lines = read_lines_from_file(input_path)
+        except OSError as e:
+            # Covers a missing file (FileNotFoundError) as well as any other
+            # IO failure; the exception text says which one it was.
             print(f"Error reading file {input_path}: {e}", file=sys.stderr)
-            sys.exit(3)
+            sys.exit(2)
 
         # Convert the file base name into an output name, adding '_converted'
         base = os.path.splitext(os.path.basename(input_path))[0] + "_converted"
-        out_name = unique_output_filename(base, ".md")
+        out_name, out_fd = unique_output_filename(base, ".md")
 
     else:
         # INTERACTIVE / PIPED MODE -------------------------------------------
         raw = read_input_interactively()
         # Default output filename for pasted input
-        out_name = unique_output_filename("converted_chords", ".md")
+        out_name, out_fd = unique_output_filename("converted_chords", ".md")
 
-    # Split into lines preserving empty lines. splitlines() removes the newline
-    # character; we handle rejoining at write time. This simplifies processing.
-    lines = raw.splitlines()
+        # Split into lines preserving empty lines. splitlines() removes the newline
+        # character; we handle rejoining at write time. This simplifies processing.
+        lines = raw.splitlines()
 
-    # Process the lines to convert chord-only lines into inline chords.
+    # Process the lines to convert chord-only lines into inline chords. This is
+    # lazy: lines are converted as the writer consumes them.
     converted = process_lines(lines)
 
-    # Write the converted content to a file in the current working directory.
-    output_path = write_output_file(out_name, converted)
+    # Stream the converted content to a file in the current working directory.
+    output_path = write_output_file(out_name, out_fd, converted)
 
     # Print a helpful completion message with the absolute path to the output file.
     print(f"\n✅ Conversion complete — markdown saved to:\n{output_path}")